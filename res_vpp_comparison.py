@@ -12,18 +12,23 @@ Purpose:
 
 Requirements:
     - Python 3.12+
-    - pandas
+    - pandas 2.2+
     - rapidfuzz
     - openpyxl
+    - pyarrow
     - Custom automation library (tech_library)
     - Windows environment with appropriate browser drivers
 """
 
 import os
 import sys
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from rapidfuzz import process, fuzz
+from rapidfuzz.utils import default_process
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import PatternFill, Font, Border, Side
@@ -34,18 +39,43 @@ from datetime import datetime
 sys.path.append(r"path/to/your/automation/library")
 import tech_library as tech
 
+# Enable Copy-on-Write so filtered frames are only copied when written to
+# (always enabled from pandas 3.0, where the option is deprecated)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 # Configuration Constants
 FUZZY_MATCH_THRESHOLD = 85
 STREET_SIMILARITY_HIGHLIGHT_THRESHOLD = 80
+MAX_COLUMN_WIDTH = 60
 OUTPUT_FOLDER = r"path/to/output/folder"
+CACHE_FOLDER = os.path.join(OUTPUT_FOLDER, ".cache")
 
 
 def normalize_customer_keys(df):
-    """Normalize customer keys by removing commas and converting to string."""
-    df["Customer Key"] = df["Customer Key"].astype(str).str.replace(",", "")
+    """
+    Normalize customer keys and store text columns as Arrow-backed strings.
+
+    Keys have commas removed and are converted to categorical; names and streets
+    are kept in contiguous Arrow buffers so vectorized string operations run in C.
+    """
+    df["Customer Key"] = (
+        df["Customer Key"]
+        .astype("string[pyarrow]")
+        .str.replace(",", "", regex=False)
+        .astype("category")
+    )
+    for col in ("Customer Name", "Street"):
+        if col in df.columns:
+            df[col] = df[col].astype("string[pyarrow]")
     return df
 
 
+def preprocess_name(name):
+    """Lowercase, strip punctuation and sort tokens for comparing with fuzz.ratio."""
+    return " ".join(sorted(default_process(name).split()))
+
+
 def create_broad_summary(res_df, vpp_df):
     """
     Create summary of customers with both RES and VPP accounts.
@@ -58,29 +88,86 @@ def create_broad_summary(res_df, vpp_df):
         pd.DataFrame: Summary of combined accounts
     """
     # Find common customer keys
-    common_keys = set(res_df["Customer Key"]) & set(vpp_df["Customer Key"])
+    common_keys = pd.Index(res_df["Customer Key"].unique()).intersection(
+        pd.Index(vpp_df["Customer Key"].unique())
+    )
 
-    # Filter dataframes to common keys
-    res_trim = res_df[res_df["Customer Key"].isin(common_keys)].copy()
-    vpp_trim = vpp_df[vpp_df["Customer Key"].isin(common_keys)].copy()
+    # Combine and filter to common keys in a single pass
+    combined = pd.concat([res_df, vpp_df])
+    combined = combined[combined["Customer Key"].isin(common_keys)]
 
-    # Combine and summarize
-    combined = pd.concat([res_trim, vpp_trim])
+    # Sort once up front so account IDs are already ordered within each group
+    combined = combined.sort_values(by="Account ID")
 
     summary_df = (
-        combined.groupby(["Customer Key", "Customer Name"])
-        .agg({"Account ID": lambda x: ", ".join(sorted(x)), "Total Balance": "sum"})
+        combined.groupby(["Customer Key", "Customer Name"], sort=False, observed=True)
+        .agg({"Account ID": ", ".join, "Total Balance": "sum"})
         .sort_values(by="Total Balance", ascending=False)
         .reset_index()
     )
 
     # Clean up data
     summary_df = summary_df[summary_df["Customer Key"] != "Totals"]
-    summary_df["Customer Key"] = r"\c" + summary_df["Customer Key"].astype(str)
 
     return summary_df
 
 
+def find_best_name_matches(
+    res_names, vpp_names, res_buckets, vpp_buckets, threshold=FUZZY_MATCH_THRESHOLD
+):
+    """
+    Find the best scoring VPP name for each RES name.
+
+    Identical names are matched with a single hash lookup. The remaining names
+    are only compared within the same bucket, which skips most pairs before any
+    similarity scoring is done.
+
+    Args:
+        res_names (pd.Series): Normalized RES customer names
+        vpp_names (pd.Series): Normalized VPP customer names
+        res_buckets (pd.Series): Bucket label for each RES name
+        vpp_buckets (pd.Series): Bucket label for each VPP name
+        threshold (int): Minimum similarity score for matches
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Position of the best VPP name for each RES
+            name and its score (0 where no name meets the threshold)
+    """
+    res_array = res_names.to_numpy()
+    vpp_array = vpp_names.to_numpy()
+
+    # Exact matches need no fuzzy scoring; point each at the first identical name
+    vpp_first = np.flatnonzero(~pd.Index(vpp_array).duplicated())
+    best = pd.Index(vpp_array[vpp_first]).get_indexer(res_array)
+    exact = (best >= 0) & (res_array != "")
+    best[exact] = vpp_first[best[exact]]
+    best[~exact] = 0
+    best_scores = np.where(exact, 100, 0).astype(np.float32)
+
+    res_groups = res_names.groupby(res_buckets.where(~exact).to_numpy()).indices
+    vpp_groups = vpp_names.groupby(vpp_buckets.to_numpy()).indices
+
+    for bucket, res_pos in res_groups.items():
+        vpp_pos = vpp_groups.get(bucket)
+        if vpp_pos is None:
+            continue
+
+        # Score the bucket's RES names against its VPP names in one batched call
+        scores = process.cdist(
+            res_array[res_pos],
+            vpp_array[vpp_pos],
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=threshold,
+            workers=-1,
+        )
+        bucket_best = scores.argmax(axis=1)
+        best[res_pos] = vpp_pos[bucket_best]
+        best_scores[res_pos] = scores[np.arange(len(res_pos)), bucket_best]
+
+    return best, best_scores
+
+
 def perform_fuzzy_matching(res_df, vpp_df, threshold=FUZZY_MATCH_THRESHOLD):
     """
     Find probable matches between RES and VPP customers using fuzzy name matching.
@@ -94,8 +181,8 @@ def perform_fuzzy_matching(res_df, vpp_df, threshold=FUZZY_MATCH_THRESHOLD):
         pd.DataFrame: Probable matches with similarity scores
     """
     # Get customers that only appear in one dataset
-    res_only = res_df[~res_df["Customer Key"].isin(vpp_df["Customer Key"])].copy()
-    vpp_only = vpp_df[~vpp_df["Customer Key"].isin(res_df["Customer Key"])].copy()
+    res_only = res_df[~res_df["Customer Key"].isin(vpp_df["Customer Key"])]
+    vpp_only = vpp_df[~vpp_df["Customer Key"].isin(res_df["Customer Key"])]
 
     # Clean data
     res_only = res_only.dropna(subset=["Customer Name"]).drop_duplicates(
@@ -105,48 +192,81 @@ def perform_fuzzy_matching(res_df, vpp_df, threshold=FUZZY_MATCH_THRESHOLD):
         subset=["Customer Key", "Customer Name"]
     )
 
-    matches = []
-    vpp_names = list(vpp_only["Customer Name"])
+    # Normalize names once up front instead of on every comparison
+    res_only["_norm"] = res_only["Customer Name"].map(preprocess_name)
+    vpp_only["_norm"] = vpp_only["Customer Name"].map(preprocess_name)
 
-    for _, res_row in res_only.iterrows():
-        res_name = res_row["Customer Name"]
-        res_key = res_row["Customer Key"]
+    # Bucket on the surname initial, which token sorting would otherwise
+    # move whenever a middle initial or suffix sorts ahead of it
+    res_only["_bucket"] = res_only["Customer Name"].map(default_process).str[0]
+    vpp_only["_bucket"] = vpp_only["Customer Name"].map(default_process).str[0]
 
-        match = process.extractOne(
-            res_name, vpp_names, scorer=fuzz.token_sort_ratio, score_cutoff=threshold
-        )
+    # Score each distinct (name, bucket) pair only once
+    res_codes = (
+        res_only.groupby(["_norm", "_bucket"], sort=False, observed=True, dropna=False)
+        .ngroup()
+        .to_numpy()
+    )
+    vpp_codes = (
+        vpp_only.groupby(["_norm", "_bucket"], sort=False, observed=True, dropna=False)
+        .ngroup()
+        .to_numpy()
+    )
+    res_unique = res_only.iloc[np.unique(res_codes, return_index=True)[1]]
+    vpp_first = np.unique(vpp_codes, return_index=True)[1]
+    vpp_unique = vpp_only.iloc[vpp_first]
+
+    best, best_scores = find_best_name_matches(
+        res_unique["_norm"],
+        vpp_unique["_norm"],
+        res_unique["_bucket"],
+        vpp_unique["_bucket"],
+        threshold,
+    )
 
-        if match:
-            matched_name, score, match_index = match
-            vpp_match_row = vpp_only.iloc[match_index]
-
-            if vpp_match_row["Customer Key"] != res_key:
-                # Calculate street similarity if street data is available
-                res_street = res_row.get("Street", "")
-                vpp_street = vpp_match_row.get("Street", "")
-                street_score = (
-                    fuzz.token_sort_ratio(res_street, vpp_street)
-                    if all(isinstance(x, str) for x in [res_street, vpp_street])
-                    else None
-                )
-
-                matches.append(
-                    {
-                        "RES Customer Key": r"\c" + res_key,
-                        "RES Name": res_name,
-                        "RES Street": res_street,
-                        "VPP Customer Key": r"\c" + vpp_match_row["Customer Key"],
-                        "VPP Name": matched_name,
-                        "VPP Street": vpp_street,
-                        "Name Similarity": score,
-                        "Street Similarity": street_score,
-                    }
-                )
-
-    matches_df = pd.DataFrame(matches).sort_values(
-        by="Street Similarity", ascending=False
+    # Broadcast each distinct pair's best match back to every RES row sharing it,
+    # pointing at the first VPP row with the matched name and bucket
+    name_scores = best_scores[res_codes]
+    res_idx = np.flatnonzero(name_scores >= threshold)
+    vpp_idx = vpp_first[best[res_codes[res_idx]]]
+    name_scores = name_scores[res_idx]
+
+    res_keys = res_only["Customer Key"].to_numpy()
+    vpp_keys = vpp_only["Customer Key"].to_numpy()
+    keep = res_keys[res_idx] != vpp_keys[vpp_idx]
+    res_idx, vpp_idx, name_scores = res_idx[keep], vpp_idx[keep], name_scores[keep]
+
+    res_names = res_only["Customer Name"].to_numpy()
+    vpp_names = vpp_only["Customer Name"].to_numpy()
+    res_streets = res_only.get("Street", pd.Series("", index=res_only.index))
+    vpp_streets = vpp_only.get("Street", pd.Series("", index=vpp_only.index))
+    res_streets = res_streets.to_numpy()[res_idx]
+    vpp_streets = vpp_streets.to_numpy()[vpp_idx]
+
+    # Calculate street similarity for all pairs where street data is available
+    has_streets = ~(pd.isna(res_streets) | pd.isna(vpp_streets))
+    street_scores = np.full(len(res_idx), np.nan)
+    street_scores[has_streets] = process.cpdist(
+        res_streets[has_streets],
+        vpp_streets[has_streets],
+        scorer=fuzz.token_sort_ratio,
+        workers=-1,
+        dtype=np.float64,
     )
 
+    matches_df = pd.DataFrame(
+        {
+            "RES Customer Key": res_keys[res_idx],
+            "RES Name": res_names[res_idx],
+            "RES Street": res_streets,
+            "VPP Customer Key": vpp_keys[vpp_idx],
+            "VPP Name": vpp_names[vpp_idx],
+            "VPP Street": vpp_streets,
+            "Name Similarity": np.rint(name_scores).astype(np.uint8),
+            "Street Similarity": street_scores,
+        }
+    ).sort_values(by="Street Similarity", ascending=False)
+
     return matches_df
 
 
@@ -160,34 +280,31 @@ def find_multi_account_customers(vpp_df):
     Returns:
         pd.DataFrame: Customers with multiple accounts
     """
-    duplicate_keys = vpp_df["Customer Key"].value_counts()[lambda x: x > 1].index
-    duplicate_df = vpp_df[vpp_df["Customer Key"].isin(duplicate_keys)].copy()
+    duplicate_df = vpp_df[vpp_df["Customer Key"].duplicated(keep=False)]
     duplicate_df = duplicate_df.sort_values(by=["Customer Key", "Account ID"])
-    duplicate_df["Customer Key"] = r"\c" + duplicate_df["Customer Key"].astype(str)
 
     return duplicate_df
 
 
-def auto_adjust_column_width(ws):
+def prefix_customer_keys(df):
+    """Add the \\c prefix to every customer key column of an export dataframe."""
+    key_columns = [col for col in df.columns if col.endswith("Customer Key")]
+    return df.assign(
+        **{col: df[col].astype(object).astype(str).radd(r"\c") for col in key_columns}
+    )
+
+
+def auto_adjust_column_width(ws, df):
     """Auto-adjust column widths based on content."""
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column
-        column_letter = get_column_letter(column)
-        for cell in col:
-            try:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            except (AttributeError, TypeError) as e:
-                print(
-                    f"Warning: Could not read cell value in column {column_letter}: {e}"
-                )
-        adjusted_width = max_length + 2
-        ws.column_dimensions[column_letter].width = adjusted_width
-
-
-def format_header(ws):
-    """Format header row with bold font and borders."""
+    for column, name in enumerate(df.columns, start=1):
+        lengths = df[name].dropna().astype(str).str.len()
+        max_length = max(int(lengths.max()) if len(lengths) else 0, len(str(name)))
+        adjusted_width = min(max_length + 2, MAX_COLUMN_WIDTH)
+        ws.column_dimensions[get_column_letter(column)].width = adjusted_width
+
+
+def header_cells(ws, header):
+    """Build bold, bordered header cells for a write-only sheet."""
     bold_font = Font(bold=True)
     thin_border = Border(
         left=Side(style="thin"),
@@ -196,53 +313,78 @@ def format_header(ws):
         bottom=Side(style="thin"),
     )
 
-    for cell in ws[1]:
+    cells = []
+    for value in header:
+        cell = WriteOnlyCell(ws, value=value)
         cell.font = bold_font
         cell.border = thin_border
+        cells.append(cell)
+    return cells
 
 
-def highlight_high_similarity_matches(ws_matches):
-    """Highlight fuzzy matches with high street similarity."""
-    try:
-        sim_col = [cell.value for cell in ws_matches[1]].index("Street Similarity") + 1
-        highlight_fill = PatternFill(
-            start_color="FFFF00", end_color="FFFF00", fill_type="solid"
-        )
+def fill_row(ws, row, fill):
+    """Wrap row values in write-only cells with the given fill."""
+    cells = []
+    for value in row:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.fill = fill
+        cells.append(cell)
+    return cells
+
+
+def similarity_row_fills(matches_df):
+    """Pick row fills highlighting fuzzy matches with high street similarity."""
+    if "Street Similarity" not in matches_df.columns:
+        return [None] * len(matches_df)  # Column not found
+
+    highlight_fill = PatternFill(
+        start_color="FFFF00", end_color="FFFF00", fill_type="solid"
+    )
+    similarity = pd.to_numeric(matches_df["Street Similarity"], errors="coerce")
+    return np.where(
+        similarity > STREET_SIMILARITY_HIGHLIGHT_THRESHOLD, highlight_fill, None
+    )
 
-        for row in ws_matches.iter_rows(min_row=2):
-            cell = row[sim_col - 1]
-            try:
-                if float(cell.value) > STREET_SIMILARITY_HIGHLIGHT_THRESHOLD:
-                    for c in row:
-                        c.fill = highlight_fill
-            except (ValueError, TypeError):
-                continue
-    except ValueError:
-        pass  # Column not found
 
+def alternating_row_fills(duplicate_df):
+    """Pick alternating row fills for multi-account customers by Customer Key."""
+    if "Customer Key" not in duplicate_df.columns:
+        return [None] * len(duplicate_df)  # Column not found
 
-def apply_alternating_colors(ws_multi):
-    """Apply alternating colors to multi-account customers grouped by Customer Key."""
     grey_fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
     white_fill = PatternFill(
         start_color="FFFFFF", end_color="FFFFFF", fill_type="solid"
     )
 
-    try:
-        custkey_col = [cell.value for cell in ws_multi[1]].index("Customer Key") + 1
-        prev_key = None
-        use_grey = True
-
-        for row in ws_multi.iter_rows(min_row=2):
-            current_key = row[custkey_col - 1].value
-            if current_key != prev_key:
-                use_grey = not use_grey
-                prev_key = current_key
-            row_fill = grey_fill if use_grey else white_fill
-            for cell in row:
-                cell.fill = row_fill
-    except ValueError:
-        pass  # Column not found
+    # Number each run of identical keys, starting the first group on white
+    keys = duplicate_df["Customer Key"]
+    group_number = (keys != keys.shift()).cumsum()
+    return np.where(group_number % 2 == 0, grey_fill, white_fill)
+
+
+def write_sheet(wb, title, df, row_fills=None):
+    """
+    Stream a dataframe into a new worksheet of a write-only workbook.
+
+    Write-only sheets cannot be edited after rows are appended, so column widths
+    and row styles are worked out before anything is written.
+
+    Args:
+        wb (Workbook): Write-only workbook
+        title (str): Sheet title
+        df (pd.DataFrame): Data to write
+        row_fills (callable): Optional function returning a fill (or None) per row
+    """
+    ws = wb.create_sheet(title)
+    df = prefix_customer_keys(df)
+    # openpyxl cannot write pd.NA from Arrow-backed columns, so use empty cells
+    df = df.astype(object).where(df.notna(), None)
+    auto_adjust_column_width(ws, df)
+    ws.append(header_cells(ws, df.columns))
+
+    fills = row_fills(df) if row_fills else [None] * len(df)
+    for row, fill in zip(dataframe_to_rows(df, index=False, header=False), fills):
+        ws.append(fill_row(ws, row, fill) if fill is not None else row)
 
 
 def export_to_excel(summary_df, matches_df, duplicate_df, output_folder=OUTPUT_FOLDER):
@@ -265,36 +407,100 @@ def export_to_excel(summary_df, matches_df, duplicate_df, output_folder=OUTPUT_F
         output_folder, f"RES_VPP_Comparison_{datetime.now().strftime('%Y%m%d')}.xlsx"
     )
 
-    wb = Workbook()
-
-    # Summary Sheet
-    ws_summary = wb.active
-    ws_summary.title = "Combined Accounts Summary"
-    for r in dataframe_to_rows(summary_df, index=False, header=True):
-        ws_summary.append(r)
-    format_header(ws_summary)
-    auto_adjust_column_width(ws_summary)
-
-    # Fuzzy Matches Sheet
-    ws_matches = wb.create_sheet("Probable Matches")
-    for r in dataframe_to_rows(matches_df, index=False, header=True):
-        ws_matches.append(r)
-    format_header(ws_matches)
-    auto_adjust_column_width(ws_matches)
-    highlight_high_similarity_matches(ws_matches)
-
-    # Multi-Account Sheet
-    ws_multi = wb.create_sheet("Multi-Account Customers")
-    for r in dataframe_to_rows(duplicate_df, index=False, header=True):
-        ws_multi.append(r)
-    format_header(ws_multi)
-    auto_adjust_column_width(ws_multi)
-    apply_alternating_colors(ws_multi)
+    wb = Workbook(write_only=True)
+
+    write_sheet(wb, "Combined Accounts Summary", summary_df)
+    write_sheet(wb, "Probable Matches", matches_df, similarity_row_fills)
+    write_sheet(wb, "Multi-Account Customers", duplicate_df, alternating_row_fills)
 
     wb.save(file_path)
     return file_path
 
 
+def download_report(driver, parameters):
+    """
+    Generate a Delinquent Account Detail report and load it into a dataframe.
+
+    Args:
+        driver: Logged-in web driver
+        parameters (dict): Report parameter selectors and values
+
+    Returns:
+        pd.DataFrame: Downloaded report
+    """
+    tech.choose_report(
+        driver, report_name="Delinquent Account Detail", parameters=parameters
+    )
+    download = tech.choose_view(driver, view_name="detailed_view")
+    df = tech.process_download(downloads_list=download)
+    tech.close_report_manager(driver)
+
+    return df
+
+
+def get_cache_path(name, cache_folder=CACHE_FOLDER):
+    """Build the path of today's cached copy of a report."""
+    return os.path.join(
+        cache_folder, f"{name}_{datetime.now().strftime('%Y%m%d')}.parquet"
+    )
+
+
+def load_cached_report(name, cache_folder=CACHE_FOLDER):
+    """Load today's cached copy of a report, or None if it has not been cached."""
+    cache_path = get_cache_path(name, cache_folder)
+    if not os.path.exists(cache_path):
+        return None
+
+    print(f"Loading cached {name} report from: {cache_path}")
+    return pd.read_parquet(cache_path)
+
+
+def save_cached_report(name, df, cache_folder=CACHE_FOLDER):
+    """Save a downloaded report so reruns on the same day can skip the download."""
+    cache_path = get_cache_path(name, cache_folder)
+    temp_path = cache_path + ".tmp"
+
+    try:
+        os.makedirs(cache_folder, exist_ok=True)
+        df.to_parquet(temp_path, index=False)
+        os.replace(temp_path, cache_path)
+    except (ImportError, OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not cache {name} report: {e}")
+
+
+def fetch_report(name, parameters, username):
+    """
+    Load today's cached copy of a report, or download it in a new browser session.
+
+    Each download uses its own web driver so reports can be fetched in parallel.
+
+    Args:
+        name (str): Report name used for the cache file (e.g. "RES")
+        parameters (dict): Report parameter selectors and values
+        username (str): User to log into the system as
+
+    Returns:
+        pd.DataFrame: Report data
+    """
+    df = load_cached_report(name)
+    if df is not None:
+        return df
+
+    driver = tech.create_driver()
+    try:
+        tech.open_system(driver)
+        tech.system_login(driver, username)
+        print(f"Successfully logged into system for {name} report")
+
+        print(f"Generating {name} delinquent report...")
+        df = download_report(driver, parameters)
+    finally:
+        driver.quit()
+
+    save_cached_report(name, df)
+    return df
+
+
 def main():
     """Main execution function."""
     print("Starting delinquent account report automation...")
@@ -313,36 +519,22 @@ def main():
     username = os.getlogin()
     print(f"Logged in as: {username}")
 
-    # Initialize web driver
-    driver = tech.create_driver()
-
     try:
-        # Login to system
-        tech.open_system(driver)
-        tech.system_login(driver, username)
-        print("Successfully logged into system")
-
-        # Generate Real Estate report
-        print("Generating Real Estate delinquent report...")
-        tech.choose_report(
-            driver, report_name="Delinquent Account Detail", parameters=res_report_args
-        )
-        download = tech.choose_view(driver, view_name="detailed_view")
-        res_df = tech.process_download(downloads_list=download)
-        tech.close_report_manager(driver)
-
-        # Generate Personal Property report
-        print("Generating Personal Property delinquent report...")
-        tech.choose_report(
-            driver, report_name="Delinquent Account Detail", parameters=vpp_report_args
-        )
-        download = tech.choose_view(driver, view_name="detailed_view")
-        vpp_df = tech.process_download(downloads_list=download)
+        # Fetch both reports concurrently, each in its own browser session
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            res_df, vpp_df = executor.map(
+                fetch_report,
+                ("RES", "VPP"),
+                (res_report_args, vpp_report_args),
+                (username, username),
+            )
 
         # Data processing
         print("Processing data...")
         res_df = normalize_customer_keys(res_df)
         vpp_df = normalize_customer_keys(vpp_df)
+        res_df["Customer Name"] = res_df["Customer Name"].astype("category")
+        vpp_df["Customer Name"] = vpp_df["Customer Name"].astype("category")
 
         # Analysis
         print("Creating broad summary...")
@@ -367,10 +559,6 @@ def main():
         tech.send_notification(error_msg)
         raise
 
-    finally:
-        if "driver" in locals():
-            driver.quit()
-
 
 if __name__ == "__main__":
     main()